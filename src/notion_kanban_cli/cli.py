@@ -1,16 +1,17 @@
 """Main CLI entry point for Notion Kanban CLI tool."""
 
-import asyncio
-import json
+# asyncio, orjson, uvloop and, in client.py, httpx are imported where they're
+# used so that --help and argument errors don't pay for importing them.
 import sys
-from typing import Any
+from enum import Enum
+from typing import Annotated, Any, Awaitable, Callable
 
 import typer
-from typing_extensions import Annotated
 
 from .client import NotionAPIError, NotionClient
-from .schema import DatabaseSchema, get_database_schema
-from .transform import transform_property_value
+from .filter_dsl import build_filter, parse_filter
+from .schema import DatabaseSchema, clear_schema_cache, get_database_schema
+from .transform import to_arrow, transform_properties
 
 app = typer.Typer(
     name="notion-tool",
@@ -27,16 +28,138 @@ def output_json(success: bool, data: Any = None, error: dict | None = None) -> N
         data: The response data (if successful)
         error: Error information (if failed)
     """
+    import orjson
+
     response: dict[str, Any] = {
         "success": success,
         "data": data,
         "error": error,
     }
-    print(json.dumps(response, indent=2, default=str))
+    sys.stdout.buffer.write(orjson.dumps(response, option=orjson.OPT_INDENT_2, default=str))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def format_page(
+    page: dict[str, Any], transform: Callable[[dict[str, Any]], dict[str, Any]] = transform_properties
+) -> dict[str, Any]:
+    """Convert a Notion page into the item format printed by the CLI.
+
+    Args:
+        page: Page object as returned by the Notion API
+        transform: Function transforming the page's properties
+
+    Returns:
+        The page metadata with its properties transformed to plain values
+    """
+    return {
+        "id": page["id"],
+        "created_time": page["created_time"],
+        "last_edited_time": page["last_edited_time"],
+        "archived": page["archived"],
+        "properties": transform(page["properties"]),
+        "url": page["url"],
+    }
+
+
+class OutputFormat(str, Enum):
+    """Output formats supported by the query command."""
+
+    json = "json"
+    arrow = "arrow"
+    parquet = "parquet"
+
+
+def output_table(table: Any, output: OutputFormat) -> None:
+    """Write an Arrow table to stdout as an Arrow IPC stream or Parquet file.
+
+    Args:
+        table: The pyarrow Table to write
+        output: Either OutputFormat.arrow or OutputFormat.parquet
+    """
+    import pyarrow as pa
+
+    sink = sys.stdout.buffer
+    if output == OutputFormat.parquet:
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+    sink.flush()
+
+
+class CLIState:
+    """Per-invocation state shared by all commands.
+
+    Holds a single lazily-created NotionClient so every API call made during
+    one CLI invocation reuses the same connection pool.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self) -> None:
+        self._client: NotionClient | None = None
+
+    @property
+    def client(self) -> NotionClient:
+        """Get or create the shared Notion client."""
+        if self._client is None:
+            self._client = NotionClient()
+        return self._client
+
+    async def close(self) -> None:
+        """Close the shared Notion client, if one was created."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+@app.callback()
+def callback(
+    ctx: typer.Context,
+    refresh_schema: Annotated[
+        bool, typer.Option("--refresh-schema", help="Discard cached database schemas before running")
+    ] = False,
+) -> None:
+    """CLI tool for interacting with Notion kanban boards."""
+    if refresh_schema:
+        clear_schema_cache()
+    ctx.obj = CLIState()
+
+
+def run_with_client(ctx: typer.Context, func: Callable[[NotionClient], Awaitable[None]]) -> None:
+    """Run an async command body with the shared client, closing it afterwards.
+
+    Args:
+        ctx: Typer context holding the CLIState
+        func: Async function receiving the shared NotionClient
+    """
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:  # Not available on Windows
+        uvloop = None
+
+    state: CLIState = ctx.ensure_object(CLIState)
+
+    async def _run() -> None:
+        try:
+            await func(state.client)
+        finally:
+            await state.close()
+
+    # Prefer libuv's event loop when available; it's cheaper to start and faster on sockets
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(_run())
 
 
 @app.command()
 def read(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
     item_id: Annotated[str, typer.Argument(help="ID of the item to read")],
 ) -> None:
@@ -46,40 +169,25 @@ def read(
         notion-tool read --database 0509def271a84947b6a55ddf1caee4df page-id
     """
 
-    async def _read() -> None:
-        async with NotionClient() as client:
-            try:
-                page = await client.get_page(item_id)
+    async def _read(client: NotionClient) -> None:
+        try:
+            page = await client.get_page(item_id)
 
-                # Transform properties to more useful format
-                properties: dict[str, Any] = {}
-                for prop_name, prop_data in page.get("properties", {}).items():
-                    properties[prop_name] = transform_property_value(prop_data)
+            output_json(success=True, data=format_page(page))
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
 
-                output_json(
-                    success=True,
-                    data={
-                        "id": page.get("id"),
-                        "created_time": page.get("created_time"),
-                        "last_edited_time": page.get("last_edited_time"),
-                        "archived": page.get("archived"),
-                        "properties": properties,
-                        "url": page.get("url"),
-                    },
-                )
-            except NotionAPIError as e:
-                output_json(
-                    success=False,
-                    error={"message": str(e), "status_code": e.status_code},
-                )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
-
-    asyncio.run(_read())
+    run_with_client(ctx, _read)
 
 
 @app.command()
 def update_status(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
     item_id: Annotated[str, typer.Argument(help="ID of the item to update")],
     status: Annotated[str, typer.Argument(help="New status value")],
@@ -90,56 +198,151 @@ def update_status(
         notion-tool update-status --database 0509def271a84947b6a55ddf1caee4df page-id "In Progress"
     """
 
-    async def _update_status() -> None:
-        async with NotionClient() as client:
-            try:
-                # Get database schema to find status property
-                schema = await get_database_schema(client, database)
-                status_prop_name = schema.get_status_property_name()
-
-                if not status_prop_name:
-                    output_json(
-                        success=False,
-                        error={"message": "No status property found in database"},
-                    )
-                    return
-
-                # Check if status is valid
-                status_options = schema.get_status_options()
-                if status_options and status not in status_options:
-                    output_json(
-                        success=False,
-                        error={
-                            "message": f"Invalid status '{status}'",
-                            "available_options": status_options,
-                        },
-                    )
-                    return
+    async def _update_status(client: NotionClient) -> None:
+        try:
+            # Get database schema to find status property
+            schema = await get_database_schema(client, database)
+            status_prop_name = schema.get_status_property_name()
 
-                # Update the page
-                await client.update_page(item_id, {status_prop_name: {"status": {"name": status}}})
+            if not status_prop_name:
+                output_json(
+                    success=False,
+                    error={"message": "No status property found in database"},
+                )
+                return
 
+            # Check if status is valid
+            status_options = schema.get_status_options()
+            if status_options and status not in status_options:
                 output_json(
-                    success=True,
-                    data={
-                        "id": item_id,
-                        "status": status,
-                        "property": status_prop_name,
+                    success=False,
+                    error={
+                        "message": f"Invalid status '{status}'",
+                        "available_options": status_options,
                     },
                 )
-            except NotionAPIError as e:
+                return
+
+            # Update the page
+            await client.update_page(item_id, {status_prop_name: {"status": {"name": status}}})
+
+            output_json(
+                success=True,
+                data={
+                    "id": item_id,
+                    "status": status,
+                    "property": status_prop_name,
+                },
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+
+    run_with_client(ctx, _update_status)
+
+
+@app.command()
+def bulk_update_status(
+    ctx: typer.Context,
+    database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", "-c", min=1, help="Number of concurrent update workers")
+    ] = 8,
+) -> None:
+    """Update the status of many items, read as JSON lines from stdin.
+
+    Each line must be an object like {"id": "page-id", "status": "Done"}.
+
+    Example:
+        cat moves.jsonl | notion-tool bulk-update-status --database 0509def271a84947b6a55ddf1caee4df
+    """
+
+    async def _bulk_update_status(client: NotionClient) -> None:
+        import asyncio
+
+        import orjson
+
+        try:
+            schema = await get_database_schema(client, database)
+            status_prop_name = schema.get_status_property_name()
+
+            if not status_prop_name:
                 output_json(
                     success=False,
-                    error={"message": str(e), "status_code": e.status_code},
+                    error={"message": "No status property found in database"},
                 )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
-
-    asyncio.run(_update_status())
+                return
+
+            status_options = schema.get_status_options()
+            queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+            failures: list[dict[str, Any]] = []
+            updated = 0
+
+            # Validate everything up front so workers only do network calls
+            for line_number, line in enumerate(sys.stdin, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = orjson.loads(line)
+                    item_id, status = item["id"], item["status"]
+                except (orjson.JSONDecodeError, TypeError, KeyError):
+                    failures.append(
+                        {"line": line_number, "message": 'Expected {"id": ..., "status": ...}'}
+                    )
+                    continue
+                if status_options and status not in status_options:
+                    failures.append(
+                        {
+                            "line": line_number,
+                            "id": item_id,
+                            "message": f"Invalid status '{status}'",
+                            "available_options": status_options,
+                        }
+                    )
+                    continue
+                queue.put_nowait((item_id, status))
+
+            async def _worker() -> None:
+                nonlocal updated
+                while not queue.empty():
+                    item_id, status = queue.get_nowait()
+                    try:
+                        await client.update_page(item_id, {status_prop_name: {"status": {"name": status}}})
+                        updated += 1
+                    except NotionAPIError as e:
+                        failures.append({"id": item_id, "message": str(e), "status_code": e.status_code})
+                    except Exception as e:
+                        failures.append({"id": item_id, "message": str(e)})
+
+            # Workers overlap request latency; the client's rate limiter paces
+            # them to Notion's request rate
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(min(concurrency, queue.qsize())):
+                    tg.create_task(_worker())
+
+            output_json(
+                success=not failures,
+                data={"property": status_prop_name, "updated": updated, "failed": len(failures)},
+                error={"message": f"{len(failures)} update(s) failed", "failures": failures} if failures else None,
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+
+    run_with_client(ctx, _bulk_update_status)
 
 
 @app.command()
 def add_note(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
     item_id: Annotated[str, typer.Argument(help="ID of the item to add note to")],
     note: Annotated[str, typer.Argument(help="Note content")],
@@ -150,44 +353,116 @@ def add_note(
         notion-tool add-note --database 0509def271a84947b6a55ddf1caee4df page-id "Task completed"
     """
 
-    async def _add_note() -> None:
-        async with NotionClient() as client:
-            try:
-                # First, get existing discussions
-                discussions = await client.list_discussions(item_id)
-                discussion_id = None
+    async def _add_note(client: NotionClient) -> None:
+        try:
+            # First, get existing discussions
+            discussions = await client.list_discussions(item_id)
+            discussion_id = None
+
+            # Use the first discussion or create a new one
+            if discussions.get("results"):
+                discussion_id = discussions["results"][0]["id"]
+
+            # Note: Notion API currently requires an existing discussion_id
+            # This is a limitation of the current API
+            output_json(
+                success=False,
+                error={
+                    "message": "Adding comments requires a discussion_id. This feature is currently limited.",
+                    "note": "Please use the Notion web UI to add comments.",
+                },
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+
+    run_with_client(ctx, _add_note)
+
+
+def build_query_filter(
+    schema: DatabaseSchema,
+    status: str | None = None,
+    tags: str | None = None,
+    filter: str | None = None,
+) -> dict | None:
+    """Translate the query options into a single Notion filter object.
 
-                # Use the first discussion or create a new one
-                if discussions.get("results"):
-                    discussion_id = discussions["results"][0]["id"]
+    Args:
+        schema: Schema of the database being queried
+        status: Status to match
+        tags: Comma-separated tags that must all be present
+        filter: Custom filter (e.g., 'priority=high' or 'priority!=low')
 
-                # Note: Notion API currently requires an existing discussion_id
-                # This is a limitation of the current API
-                output_json(
-                    success=False,
-                    error={
-                        "message": "Adding comments requires a discussion_id. This feature is currently limited.",
-                        "note": "Please use the Notion web UI to add comments.",
-                    },
-                )
-            except NotionAPIError as e:
-                output_json(
-                    success=False,
-                    error={"message": str(e), "status_code": e.status_code},
-                )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
+    Returns:
+        The Notion filter object, or None if nothing needs filtering
 
-    asyncio.run(_add_note())
+    Raises:
+        ValueError: If the custom filter is malformed or names an unknown property
+    """
+    # Every provided predicate is combined into a single "and" so Notion
+    # does the selection server-side.
+    predicates: list[dict] = []
+
+    if status:
+        status_prop_name = schema.get_status_property_name()
+        if status_prop_name:
+            predicates.append(
+                {
+                    "property": status_prop_name,
+                    "status": {"equals": status},
+                }
+            )
+
+    if tags:
+        tag_props = schema.get_tag_property_names()
+        if tag_props:
+            tag_list = [t.strip() for t in tags.split(",") if t.strip()]
+            tag_prop_name = tag_props[0]  # Use first tag property
+            predicates.extend(
+                {"property": tag_prop_name, "multi_select": {"contains": tag}}
+                for tag in tag_list
+            )
+
+    if filter:
+        prop_name, op, value = parse_filter(filter)
+        prop_def = schema.find_property_by_name(prop_name)
+        if not prop_def:
+            raise ValueError(f"Unknown property '{prop_name}' in filter")
+        # Use the schema's spelling; Notion property names are case-sensitive
+        prop_name = prop_def.get("name", prop_name)
+        predicates.append(build_filter(prop_name, prop_def.get("type"), op, value))
+
+    if not predicates:
+        return None
+    if len(predicates) == 1:
+        return predicates[0]
+    return {"and": predicates}
 
 
 @app.command()
 def query(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
     status: Annotated[str | None, typer.Option("--status", "-s", help="Filter by status")] = None,
     tags: Annotated[str | None, typer.Option("--tags", "-t", help="Filter by tags (comma-separated)")] = None,
-    filter: Annotated[str | None, typer.Option("--filter", "-f", help="Custom filter (e.g., 'priority=high')")] = None,
-    limit: Annotated[int | None, typer.Option("--limit", "-l", help="Maximum number of results")] = None,
+    filter: Annotated[
+        str | None, typer.Option("--filter", "-f", help="Custom filter (e.g., 'priority=high' or 'priority!=low')")
+    ] = None,
+    limit: Annotated[
+        int | None, typer.Option("--limit", "-l", min=1, help="Maximum number of results (default: all)")
+    ] = None,
+    properties: Annotated[
+        str | None,
+        typer.Option("--properties", "-p", help="Only return these properties (comma-separated)"),
+    ] = None,
+    output: Annotated[
+        OutputFormat,
+        typer.Option("--output", "-o", help="Output format; arrow and parquet are written as binary to stdout"),
+    ] = OutputFormat.json,
 ) -> None:
     """Query items from the database.
 
@@ -195,104 +470,101 @@ def query(
         notion-tool query --database 0509def271a84947b6a55ddf1caee4df --status "In Progress"
         notion-tool query --database 0509def271a84947b6a55ddf1caee4df --tags "urgent,important"
         notion-tool query --database 0509def271a84947b6a55ddf1caee4df --limit 5
+        notion-tool query --database 0509def271a84947b6a55ddf1caee4df --properties "Name,Status"
+        notion-tool query --database 0509def271a84947b6a55ddf1caee4df --output parquet > items.parquet
     """
 
-    async def _query() -> None:
-        async with NotionClient() as client:
-            try:
-                # Get database schema
-                schema = await get_database_schema(client, database)
-
-                # Build filter
-                filter_obj = None
-
-                if status:
-                    status_prop_name = schema.get_status_property_name()
-                    if status_prop_name:
-                        filter_obj = {
-                            "property": status_prop_name,
-                            "status": {"equals": status},
-                        }
-
-                if tags:
-                    tag_props = schema.get_tag_property_names()
-                    if tag_props:
-                        tag_list = [t.strip() for t in tags.split(",")]
-                        tag_prop_name = tag_props[0]  # Use first tag property
-                        if len(tag_list) == 1:
-                            filter_obj = {
-                                "property": tag_prop_name,
-                                "multi_select": {"contains": tag_list[0]},
-                            }
-                        else:
-                            filter_obj = {
-                                "and": [
-                                    {"property": tag_prop_name, "multi_select": {"contains": tag}}
-                                    for tag in tag_list
-                                ]
-                            }
-
-                if filter:
-                    # Parse custom filter like "priority=high"
-                    if "=" in filter:
-                        prop_name, value = filter.split("=", 1)
-                        prop_name = prop_name.strip()
-                        value = value.strip()
-
+    async def _collect(
+        client: NotionClient,
+        schema_task: Awaitable[DatabaseSchema],
+        filter_obj: dict | None,
+        property_ids: list[str] | None,
+        property_names: list[str] | None,
+    ) -> tuple[list[dict[str, Any]], dict]:
+        # Each batch is transformed while the next one is being fetched.
+        # Tabular output is transformed column-wise later, so raw pages are kept.
+        _format = format_page
+        transform = None
+        rows: list[dict[str, Any]] = []
+        last: dict = {}
+        async for batch in client.iterate_database(
+            database, filter_obj=filter_obj, limit=limit, filter_property_ids=property_ids
+        ):
+            last = batch
+            if output != OutputFormat.json:
+                rows += batch.get("results", [])
+                continue
+            if transform is None:
+                transform = (await schema_task).compile_transformer(property_names)
+            rows += [_format(page, transform) for page in batch.get("results", [])]
+
+        return rows, last
+
+    async def _query(client: NotionClient) -> None:
+        import asyncio
+
+        # Without filters the schema is only needed once results arrive,
+        # so fetch it alongside the query rather than before it
+        schema_task = asyncio.ensure_future(get_database_schema(client, database))
+        try:
+            filter_obj = None
+            property_ids = property_names = None
+            if status or tags or filter or properties:
+                # Filters and projections are translated through the schema
+                schema = await schema_task
+                filter_obj = build_query_filter(schema, status, tags, filter)
+
+                if properties:
+                    property_ids, property_names = [], []
+                    for prop_name in (p.strip() for p in properties.split(",") if p.strip()):
                         prop_def = schema.find_property_by_name(prop_name)
-                        if prop_def:
-                            prop_type = prop_def.get("type")
-                            if prop_type == "status":
-                                filter_obj = {"property": prop_name, "status": {"equals": value}}
-                            elif prop_type == "select":
-                                filter_obj = {"property": prop_name, "select": {"equals": value}}
-                            elif prop_type == "multi_select":
-                                filter_obj = {"property": prop_name, "multi_select": {"contains": value}}
-                            else:
-                                filter_obj = {"property": prop_name, "title": {"equals": value}}
-
-                # Query the database
-                result = await client.query_database(database, filter_obj=filter_obj, page_size=limit)
-
-                # Transform results
-                items = []
-                for page in result.get("results", []):
-                    properties: dict[str, Any] = {}
-                    for prop_name, prop_data in page.get("properties", {}).items():
-                        properties[prop_name] = transform_property_value(prop_data)
-
-                    items.append(
-                        {
-                            "id": page.get("id"),
-                            "created_time": page.get("created_time"),
-                            "last_edited_time": page.get("last_edited_time"),
-                            "archived": page.get("archived"),
-                            "properties": properties,
-                            "url": page.get("url"),
-                        }
-                    )
-
-                output_json(
-                    success=True,
-                    data={
-                        "items": items,
-                        "next_cursor": result.get("next_cursor"),
-                        "has_more": result.get("has_more"),
-                    },
-                )
-            except NotionAPIError as e:
-                output_json(
-                    success=False,
-                    error={"message": str(e), "status_code": e.status_code},
-                )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
-
-    asyncio.run(_query())
+                        if not prop_def:
+                            output_json(
+                                success=False,
+                                error={
+                                    "message": f"Unknown property '{prop_name}'",
+                                    "available_options": list(schema.properties),
+                                },
+                            )
+                            return
+                        property_ids.append(prop_def["id"])
+                        property_names.append(prop_def.get("name", prop_name))
+
+            rows, last = await _collect(client, schema_task, filter_obj, property_ids, property_names)
+            schema = await schema_task
+
+            if output != OutputFormat.json:
+                output_table(to_arrow(rows, property_names or list(schema.properties)), output)
+                return
+
+            output_json(
+                success=True,
+                data={
+                    "items": rows,
+                    "next_cursor": last.get("next_cursor"),
+                    "has_more": last.get("has_more", False),
+                },
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+        finally:
+            if not schema_task.done():
+                schema_task.cancel()
+            elif not schema_task.cancelled():
+                # Mark a failure as seen if the query failed first
+                schema_task.exception()
+
+    run_with_client(ctx, _query)
 
 
 @app.command()
 def list_status(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
 ) -> None:
     """List all available status options.
@@ -301,39 +573,39 @@ def list_status(
         notion-tool list-status --database 0509def271a84947b6a55ddf1caee4df
     """
 
-    async def _list_status() -> None:
-        async with NotionClient() as client:
-            try:
-                schema = await get_database_schema(client, database)
-                status_options = schema.get_status_options()
-
-                if not status_options:
-                    output_json(
-                        success=False,
-                        error={"message": "No status property found in database"},
-                    )
-                    return
+    async def _list_status(client: NotionClient) -> None:
+        try:
+            schema = await get_database_schema(client, database)
+            status_options = schema.get_status_options()
 
-                output_json(
-                    success=True,
-                    data={
-                        "property_name": schema.get_status_property_name(),
-                        "options": status_options,
-                    },
-                )
-            except NotionAPIError as e:
+            if not status_options:
                 output_json(
                     success=False,
-                    error={"message": str(e), "status_code": e.status_code},
+                    error={"message": "No status property found in database"},
                 )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
-
-    asyncio.run(_list_status())
+                return
+
+            output_json(
+                success=True,
+                data={
+                    "property_name": schema.get_status_property_name(),
+                    "options": status_options,
+                },
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+
+    run_with_client(ctx, _list_status)
 
 
 @app.command()
 def list_tags(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
 ) -> None:
     """List all available tag options.
@@ -342,43 +614,43 @@ def list_tags(
         notion-tool list-tags --database 0509def271a84947b6a55ddf1caee4df
     """
 
-    async def _list_tags() -> None:
-        async with NotionClient() as client:
-            try:
-                schema = await get_database_schema(client, database)
-                tag_props = schema.get_tag_property_names()
+    async def _list_tags(client: NotionClient) -> None:
+        try:
+            schema = await get_database_schema(client, database)
+            tag_props = schema.get_tag_property_names()
 
-                if not tag_props:
-                    output_json(
-                        success=False,
-                        error={"message": "No tag properties found in database"},
-                    )
-                    return
-
-                tags_by_property = {}
-                for tag_prop in tag_props:
-                    tags_by_property[tag_prop] = schema.get_tag_options(tag_prop)
-
-                output_json(
-                    success=True,
-                    data={
-                        "properties": tag_props,
-                        "tags_by_property": tags_by_property,
-                    },
-                )
-            except NotionAPIError as e:
+            if not tag_props:
                 output_json(
                     success=False,
-                    error={"message": str(e), "status_code": e.status_code},
+                    error={"message": "No tag properties found in database"},
                 )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
-
-    asyncio.run(_list_tags())
+                return
+
+            tags_by_property = {}
+            for tag_prop in tag_props:
+                tags_by_property[tag_prop] = schema.get_tag_options(tag_prop)
+
+            output_json(
+                success=True,
+                data={
+                    "properties": tag_props,
+                    "tags_by_property": tags_by_property,
+                },
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+
+    run_with_client(ctx, _list_tags)
 
 
 @app.command()
 def schema(
+    ctx: typer.Context,
     database: Annotated[str, typer.Option("--database", "-d", help="Notion database ID")],
 ) -> None:
     """Get database schema.
@@ -387,45 +659,45 @@ def schema(
         notion-tool schema --database 0509def271a84947b6a55ddf1caee4df
     """
 
-    async def _schema() -> None:
-        async with NotionClient() as client:
-            try:
-                schema_data = await client.get_database(database)
-
-                # Simplify the schema output
-                properties = {}
-                for prop_name, prop_def in schema_data.get("properties", {}).items():
-                    prop_type = prop_def.get("type")
-                    properties[prop_name] = {"type": prop_type}
-
-                    # Add options for select/multi_select/status
-                    if prop_type == "select":
-                        options = prop_def.get("select", {}).get("options", [])
-                        properties[prop_name]["options"] = [opt.get("name") for opt in options]
-                    elif prop_type == "multi_select":
-                        options = prop_def.get("multi_select", {}).get("options", [])
-                        properties[prop_name]["options"] = [opt.get("name") for opt in options]
-                    elif prop_type == "status":
-                        options = prop_def.get("status", {}).get("options", [])
-                        properties[prop_name]["options"] = [opt.get("name") for opt in options]
-
-                output_json(
-                    success=True,
-                    data={
-                        "id": schema_data.get("id"),
-                        "title": schema_data.get("title", [{}])[0].get("plain_text", ""),
-                        "properties": properties,
-                    },
-                )
-            except NotionAPIError as e:
-                output_json(
-                    success=False,
-                    error={"message": str(e), "status_code": e.status_code},
-                )
-            except Exception as e:
-                output_json(success=False, error={"message": str(e)})
-
-    asyncio.run(_schema())
+    async def _schema(client: NotionClient) -> None:
+        try:
+            # Always fetch fresh so this command also refreshes the cache
+            schema_data = (await get_database_schema(client, database, refresh=True)).schema_data
+
+            # Simplify the schema output
+            properties = {}
+            for prop_name, prop_def in schema_data.get("properties", {}).items():
+                prop_type = prop_def.get("type")
+                properties[prop_name] = {"type": prop_type}
+
+                # Add options for select/multi_select/status
+                if prop_type == "select":
+                    options = prop_def.get("select", {}).get("options", [])
+                    properties[prop_name]["options"] = [opt.get("name") for opt in options]
+                elif prop_type == "multi_select":
+                    options = prop_def.get("multi_select", {}).get("options", [])
+                    properties[prop_name]["options"] = [opt.get("name") for opt in options]
+                elif prop_type == "status":
+                    options = prop_def.get("status", {}).get("options", [])
+                    properties[prop_name]["options"] = [opt.get("name") for opt in options]
+
+            output_json(
+                success=True,
+                data={
+                    "id": schema_data.get("id"),
+                    "title": schema_data.get("title", [{}])[0].get("plain_text", ""),
+                    "properties": properties,
+                },
+            )
+        except NotionAPIError as e:
+            output_json(
+                success=False,
+                error={"message": str(e), "status_code": e.status_code},
+            )
+        except Exception as e:
+            output_json(success=False, error={"message": str(e)})
+
+    run_with_client(ctx, _schema)
 
 
 def main() -> None:
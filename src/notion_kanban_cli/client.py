@@ -1,6 +1,17 @@
 """Notion API client wrapper."""
 
-import httpx
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator
+from functools import cache
+from typing import TYPE_CHECKING
+from urllib.parse import unquote
+
+if TYPE_CHECKING:
+    import ssl
+
+    import httpx
 
 from .config import NOTION_API_BASE_URL, NOTION_API_VERSION, get_api_key
 
@@ -14,9 +25,76 @@ class NotionAPIError(Exception):
         self.response_data = response_data
 
 
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    """Get the SSL context shared by every client in the process.
+
+    Loading the CA bundle is the slow part of creating a context, so it's done
+    once. httpx builds it the same way it would by default, so SSL_CERT_FILE
+    and SSL_CERT_DIR are still honoured.
+    """
+    import httpx
+
+    return httpx.create_ssl_context()
+
+
+def _env_proxy(url: str) -> str | None:
+    """Get the proxy configured in the environment for a URL.
+
+    httpx only reads proxy variables when it builds its own transport, so
+    HTTPS_PROXY/ALL_PROXY and NO_PROXY are resolved here instead.
+    """
+    from urllib.parse import urlsplit
+    from urllib.request import getproxies, proxy_bypass
+
+    parts = urlsplit(url)
+    if proxy_bypass(parts.hostname):
+        return None
+    proxies = getproxies()
+    return proxies.get(parts.scheme) or proxies.get("all")
+
+
+class _TokenBucket:
+    """Token bucket limiting how many requests are started per second."""
+
+    __slots__ = ("rate", "capacity", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the allowed burst
+        """
+        import asyncio
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        import asyncio
+
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
 class NotionClient:
     """Client for interacting with the Notion API."""
 
+    __slots__ = ("api_key", "_client", "_rate_limiter", "_retry_policy")
+
     def __init__(self, api_key: str | None = None):
         """Initialize the Notion client.
 
@@ -25,18 +103,42 @@ class NotionClient:
         """
         self.api_key = api_key or get_api_key()
         self._client: httpx.AsyncClient | None = None
+        # Notion allows an average of 3 requests per second per integration
+        self._rate_limiter = _TokenBucket(rate=3, capacity=3)
+        self._retry_policy = {"max": 5, "base": 0.25, "max_delay": 30.0}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client."""
         if self._client is None:
+            import socket
+
+            import httpx
+
+            transport = httpx.AsyncHTTPTransport(
+                verify=_ssl_context(),
+                proxy=_env_proxy(NOTION_API_BASE_URL),
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+                # Retries failed connection attempts; HTTP errors are retried in _request
+                retries=2,
+                # Small JSON requests shouldn't wait on Nagle's algorithm, and
+                # keepalive probes detect dead pooled connections
+                socket_options=[
+                    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+                    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                ],
+            )
             self._client = httpx.AsyncClient(
                 base_url=NOTION_API_BASE_URL,
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
                     "Notion-Version": NOTION_API_VERSION,
                     "Content-Type": "application/json",
+                    # Query responses are large JSON and compress well
+                    "Accept-Encoding": "gzip, br",
                 },
                 timeout=30.0,
+                transport=transport,
             )
         return self._client
 
@@ -46,12 +148,20 @@ class NotionClient:
             await self._client.aclose()
             self._client = None
 
-    async def _request(self, method: str, path: str, **kwargs) -> dict:
+    async def _request(self, method: str, path: str, idempotent: bool | None = None, **kwargs) -> dict:
         """Make a request to the Notion API.
 
+        Requests are paced to Notion's rate limit. Rate-limited (429)
+        responses are retried with exponential backoff, honouring Retry-After
+        when Notion sends it, up to a capped delay. Server errors (5xx) are
+        retried the same way, but only for idempotent requests, since the
+        server may have applied a request before failing.
+
         Args:
             method: HTTP method (GET, POST, PATCH, etc.)
             path: API endpoint path
+            idempotent: Whether repeating the request is safe. Defaults to
+                True for every method except POST.
             **kwargs: Additional arguments for httpx.request
 
         Returns:
@@ -60,12 +170,27 @@ class NotionClient:
         Raises:
             NotionAPIError: If the API returns an error
         """
+        import asyncio
+
+        import orjson
+
         client = await self._get_client()
-        response = await client.request(method, path, **kwargs)
+        max_retries = self._retry_policy["max"]
+        if idempotent is None:
+            idempotent = method != "POST"
+
+        for attempt in range(max_retries + 1):
+            # Retries count against the rate limit too
+            await self._rate_limiter.acquire()
+            response = await client.request(method, path, **kwargs)
+            retryable = response.status_code == 429 or (idempotent and response.status_code >= 500)
+            if attempt == max_retries or not retryable:
+                break
+            await asyncio.sleep(self._retry_delay(response, attempt))
 
         try:
-            data = response.json()
-        except Exception:
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
             data = {}
 
         if response.status_code >= 400:
@@ -78,6 +203,14 @@ class NotionClient:
 
         return data
 
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Get how long to wait before retrying a failed request."""
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            delay = self._retry_policy["base"] * 2**attempt
+        return min(max(delay, 0.0), self._retry_policy["max_delay"])
+
     async def get_page(self, page_id: str) -> dict:
         """Get a page from Notion.
 
@@ -107,6 +240,7 @@ class NotionClient:
         sorts: list[dict] | None = None,
         start_cursor: str | None = None,
         page_size: int | None = None,
+        filter_property_ids: list[str] | None = None,
     ) -> dict:
         """Query a database.
 
@@ -116,6 +250,7 @@ class NotionClient:
             sorts: Sort configurations
             start_cursor: Cursor for pagination
             page_size: Number of results per page
+            filter_property_ids: Only return these property IDs in each page
 
         Returns:
             Query results with pages and next_cursor
@@ -130,7 +265,86 @@ class NotionClient:
         if page_size is not None:
             body["page_size"] = page_size
 
-        return await self._request("POST", f"/databases/{database_id}/query", json=body)
+        params = None
+        if filter_property_ids:
+            # Property IDs come back URL-encoded; httpx encodes query params itself
+            params = {"filter_properties": [unquote(prop_id) for prop_id in filter_property_ids]}
+
+        # Queries only read, so they're safe to retry despite being a POST
+        return await self._request(
+            "POST", f"/databases/{database_id}/query", idempotent=True, json=body, params=params
+        )
+
+    async def iterate_database(
+        self,
+        database_id: str,
+        filter_obj: dict | None = None,
+        sorts: list[dict] | None = None,
+        page_size: int = 100,
+        limit: int | None = None,
+        filter_property_ids: list[str] | None = None,
+    ) -> AsyncIterator[dict]:
+        """Query a database, following pagination until exhausted.
+
+        The next batch is fetched in the background while the caller
+        processes the current one.
+
+        Args:
+            database_id: The ID of the database
+            filter_obj: Filter object for the query
+            sorts: Sort configurations
+            page_size: Number of results per request (max 100)
+            limit: Maximum total number of results. None fetches everything.
+            filter_property_ids: Only return these property IDs in each page
+
+        Yields:
+            Query results for each batch, with pages and next_cursor
+        """
+        import asyncio
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        done = object()
+
+        async def _fetch() -> None:
+            cursor = None
+            remaining = limit
+            try:
+                while remaining is None or remaining > 0:
+                    size = page_size if remaining is None else min(page_size, remaining)
+                    result = await self.query_database(
+                        database_id,
+                        filter_obj=filter_obj,
+                        sorts=sorts,
+                        start_cursor=cursor,
+                        page_size=size,
+                        filter_property_ids=filter_property_ids,
+                    )
+                    await queue.put(result)
+
+                    cursor = result.get("next_cursor")
+                    if not result.get("has_more") or not cursor:
+                        break
+                    if remaining is not None:
+                        remaining -= len(result.get("results", []))
+                await queue.put(done)
+            except Exception as e:
+                await queue.put(e)
+
+        fetcher = asyncio.create_task(_fetch())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            fetcher.cancel()
+            try:
+                await fetcher
+            except asyncio.CancelledError:
+                pass
 
     async def update_page(self, page_id: str, properties: dict) -> dict:
         """Update a page's properties.
@@ -17,3 +17,6 @@ def get_api_key() -> str:
 
 NOTION_API_BASE_URL = "https://api.notion.com/v1"
 NOTION_API_VERSION = "2022-06-28"
+
+# How long a schema cached on disk is trusted before it is fetched again
+SCHEMA_CACHE_TTL_SECONDS = 3600
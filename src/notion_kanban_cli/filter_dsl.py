@@ -0,0 +1,84 @@
+"""Parsing and translation of custom query filters like 'priority=high'."""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable
+
+_FILTER_RE = re.compile(r"^\s*(?P<prop>.+?)\s*(?P<op>!=|=)\s*(?P<value>.*?)\s*$")
+
+_TRUE_VALUES = frozenset({"true", "yes", "1", "checked"})
+
+
+@lru_cache(maxsize=128)
+def parse_filter(expression: str) -> tuple[str, str, str]:
+    """Parse a filter expression into a (property, operator, value) tuple.
+
+    Supported operators are '=' and '!='.
+
+    Raises:
+        ValueError: If the expression is not of the form 'property=value'
+    """
+    match = _FILTER_RE.match(expression)
+    if not match:
+        raise ValueError(f"Invalid filter '{expression}', expected 'property=value' or 'property!=value'")
+    return match.group("prop"), match.group("op"), match.group("value")
+
+
+def _equals(prop_type: str) -> Callable[[str, str, str], dict[str, Any]]:
+    def build(prop_name: str, op: str, value: str) -> dict[str, Any]:
+        condition = "equals" if op == "=" else "does_not_equal"
+        return {"property": prop_name, prop_type: {condition: value}}
+
+    return build
+
+
+def _contains(prop_type: str) -> Callable[[str, str, str], dict[str, Any]]:
+    def build(prop_name: str, op: str, value: str) -> dict[str, Any]:
+        condition = "contains" if op == "=" else "does_not_contain"
+        return {"property": prop_name, prop_type: {condition: value}}
+
+    return build
+
+
+def _number(prop_name: str, op: str, value: str) -> dict[str, Any]:
+    try:
+        number = float(value)
+    except ValueError:
+        raise ValueError(f"Property '{prop_name}' is a number, got '{value}'") from None
+    condition = "equals" if op == "=" else "does_not_equal"
+    return {"property": prop_name, "number": {condition: number}}
+
+
+def _checkbox(prop_name: str, op: str, value: str) -> dict[str, Any]:
+    checked = value.lower() in _TRUE_VALUES
+    condition = "equals" if op == "=" else "does_not_equal"
+    return {"property": prop_name, "checkbox": {condition: checked}}
+
+
+# Filter builders keyed by Notion property type
+_FILTER_BUILDERS: dict[str, Callable[[str, str, str], dict[str, Any]]] = {
+    "status": _equals("status"),
+    "select": _equals("select"),
+    "multi_select": _contains("multi_select"),
+    "title": _equals("title"),
+    "rich_text": _equals("rich_text"),
+    "url": _equals("url"),
+    "email": _equals("email"),
+    "phone_number": _equals("phone_number"),
+    "number": _number,
+    "checkbox": _checkbox,
+    "people": _contains("people"),
+    "relation": _contains("relation"),
+}
+
+
+def build_filter(prop_name: str, prop_type: str, op: str, value: str) -> dict[str, Any]:
+    """Build a Notion filter object for a single property condition.
+
+    Raises:
+        ValueError: If filtering on the property type is not supported
+    """
+    builder = _FILTER_BUILDERS.get(prop_type)
+    if builder is None:
+        raise ValueError(f"Filtering on '{prop_name}' ({prop_type}) is not supported")
+    return builder(prop_name, op, value)
@@ -1,18 +1,37 @@
 """Schema discovery and caching for Notion databases."""
 
-from typing import Any
+import json
+import os
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable
+
+from platformdirs import user_cache_dir
 
 from .client import NotionClient
+from .config import SCHEMA_CACHE_TTL_SECONDS
+from .transform import compile_page_transformer
 
 
 class DatabaseSchema:
     """Represents the schema of a Notion database."""
 
+    __slots__ = ("database_id", "schema_data", "_by_lower", "_by_type", "_transformers")
+
     def __init__(self, database_id: str, schema_data: dict[str, Any]):
         self.database_id = database_id
         self.schema_data = schema_data
-        self._status_property_name = None
-        self._tag_property_names = []
+
+        # Index properties once so lookups don't rescan the schema
+        self._by_lower: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._by_type: dict[str, list[str]] = defaultdict(list)
+        for prop_name, prop_def in self.properties.items():
+            self._by_lower.setdefault(prop_name.lower(), (prop_name, prop_def))
+            self._by_type[prop_def.get("type")].append(prop_name)
+
+        self._transformers: dict[tuple[str, ...] | None, Callable[[dict[str, Any]], dict[str, Any]]] = {}
 
     @property
     def properties(self) -> dict[str, Any]:
@@ -20,29 +39,12 @@ class DatabaseSchema:
         return self.schema_data.get("properties", {})
 
     def get_status_property_name(self) -> str | None:
-        """Find and cache the name of the status property."""
-        if self._status_property_name is not None:
-            return self._status_property_name
-
-        for prop_name, prop_def in self.properties.items():
-            if prop_def.get("type") == "status":
-                self._status_property_name = prop_name
-                return prop_name
-
-        return None
+        """Find the name of the status property."""
+        return self._by_type.get("status", [None])[0]
 
     def get_tag_property_names(self) -> list[str]:
-        """Find and cache the names of tag/multi_select properties."""
-        if self._tag_property_names:
-            return self._tag_property_names
-
-        tag_names = []
-        for prop_name, prop_def in self.properties.items():
-            if prop_def.get("type") == "multi_select":
-                tag_names.append(prop_name)
-
-        self._tag_property_names = tag_names
-        return tag_names
+        """Find the names of tag/multi_select properties."""
+        return self._by_type.get("multi_select", [])
 
     def get_status_options(self) -> list[str]:
         """Get all available status options."""
@@ -60,18 +62,36 @@ class DatabaseSchema:
         tag_options = prop_def.get("multi_select", {}).get("options", [])
         return [opt.get("name", "") for opt in tag_options if opt.get("name")]
 
+    def compile_transformer(
+        self, property_names: list[str] | None = None
+    ) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        """Get a page-properties transformer specialized for this schema.
+
+        Args:
+            property_names: Properties present in each page, if the query was
+                projected. Defaults to all properties.
+        """
+        key = tuple(property_names) if property_names is not None else None
+        transformer = self._transformers.get(key)
+        if transformer is None:
+            names = property_names if property_names is not None else self.properties
+            transformer = compile_page_transformer(
+                {name: self.properties.get(name, {}).get("type") for name in names}
+            )
+            self._transformers[key] = transformer
+        return transformer
+
     def find_property_by_name(self, name: str) -> dict[str, Any] | None:
         """Find a property definition by name (case-insensitive)."""
-        name_lower = name.lower()
-        for prop_name, prop_def in self.properties.items():
-            if prop_name.lower() == name_lower:
-                return prop_def
-        return None
+        pair = self._by_lower.get(name.lower())
+        return pair[1] if pair else None
 
 
 class SchemaCache:
     """Cache for database schemas."""
 
+    __slots__ = ("_schemas",)
+
     def __init__(self):
         self._schemas: dict[str, DatabaseSchema] = {}
 
@@ -92,13 +112,81 @@ class SchemaCache:
 _schema_cache = SchemaCache()
 
 
-async def get_database_schema(client: NotionClient, database_id: str) -> DatabaseSchema:
-    """Get or fetch database schema."""
-    cached = _schema_cache.get(database_id)
-    if cached:
-        return cached
+def _disk_cache_dir() -> Path:
+    """Get the directory where schemas are persisted between invocations."""
+    return Path(user_cache_dir("notion-tool")) / "schemas"
+
+
+def _disk_cache_path(database_id: str) -> Path:
+    """Get the on-disk cache file for a database schema."""
+    return _disk_cache_dir() / f"{database_id}.json"
+
+
+def _load_from_disk(database_id: str) -> dict[str, Any] | None:
+    """Load a persisted schema if it exists and has not expired."""
+    path = _disk_cache_path(database_id)
+    try:
+        if time.time() - path.stat().st_mtime > SCHEMA_CACHE_TTL_SECONDS:
+            return None
+        with path.open("rb") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_to_disk(database_id: str, schema_data: dict[str, Any]) -> None:
+    """Persist a schema atomically. Failures are ignored; the cache is best-effort."""
+    path = _disk_cache_path(database_id)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(schema_data, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
+
+
+def clear_schema_cache() -> None:
+    """Clear cached schemas from memory and disk."""
+    _schema_cache.clear()
+    for path in _disk_cache_dir().glob("*.json"):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+async def get_database_schema(
+    client: NotionClient, database_id: str, refresh: bool = False
+) -> DatabaseSchema:
+    """Get or fetch database schema.
+
+    Schemas are looked up in memory, then on disk, and only fetched from the
+    API when neither cache has a fresh copy.
+
+    Args:
+        client: Notion client used on a cache miss
+        database_id: The ID of the database
+        refresh: Skip the caches and always fetch from the API
+    """
+    if not refresh:
+        cached = _schema_cache.get(database_id)
+        if cached:
+            return cached
+
+        schema_data = _load_from_disk(database_id)
+        if schema_data is not None:
+            schema = DatabaseSchema(database_id, schema_data)
+            _schema_cache.set(database_id, schema)
+            return schema
 
     schema_data = await client.get_database(database_id)
     schema = DatabaseSchema(database_id, schema_data)
     _schema_cache.set(database_id, schema)
+    _save_to_disk(database_id, schema_data)
     return schema
@@ -1,81 +1,206 @@
 """Property transformation utilities for Notion API responses."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
 
-def transform_property_value(prop_data: dict[str, Any]) -> Any:
-    """Transform a Notion property value to a more useful format."""
-    prop_type = prop_data.get("type")
+def _title(prop_data: dict[str, Any]) -> str:
+    return "".join(t.get("plain_text", "") for t in prop_data.get("title", []))
+
+
+def _rich_text(prop_data: dict[str, Any]) -> str:
+    return "".join(t.get("plain_text", "") for t in prop_data.get("rich_text", []))
+
+
+def _number(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("number")
+
+
+def _select(prop_data: dict[str, Any]) -> str | None:
+    select_data = prop_data.get("select")
+    return select_data.get("name") if select_data else None
+
+
+def _multi_select(prop_data: dict[str, Any]) -> list[str | None]:
+    return [s.get("name") for s in prop_data.get("multi_select", [])]
+
+
+def _status(prop_data: dict[str, Any]) -> str | None:
+    status_data = prop_data.get("status")
+    return status_data.get("name") if status_data else None
+
 
-    if prop_type == "title":
-        titles = prop_data.get("title", [])
-        return "".join(t.get("plain_text", "") for t in titles)
+def _date(prop_data: dict[str, Any]) -> str | None:
+    date_data = prop_data.get("date")
+    if date_data:
+        start = date_data.get("start")
+        if start:
+            try:
+                return datetime.fromisoformat(start).isoformat()
+            except ValueError:
+                return start
+    return None
 
-    if prop_type == "rich_text":
-        texts = prop_data.get("rich_text", [])
-        return "".join(t.get("plain_text", "") for t in texts)
 
-    if prop_type == "number":
-        return prop_data.get("number")
+def _checkbox(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("checkbox")
 
-    if prop_type == "select":
-        select_data = prop_data.get("select")
-        return select_data.get("name") if select_data else None
 
-    if prop_type == "multi_select":
-        return [s.get("name") for s in prop_data.get("multi_select", [])]
+def _url(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("url")
 
-    if prop_type == "status":
-        status_data = prop_data.get("status")
-        return status_data.get("name") if status_data else None
 
-    if prop_type == "date":
-        date_data = prop_data.get("date")
-        if date_data:
-            start = date_data.get("start")
-            if start:
-                try:
-                    return datetime.fromisoformat(start).isoformat()
-                except ValueError:
-                    return start
-        return None
+def _email(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("email")
 
-    if prop_type == "checkbox":
-        return prop_data.get("checkbox")
 
-    if prop_type == "url":
-        return prop_data.get("url")
+def _phone_number(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("phone_number")
 
-    if prop_type == "email":
-        return prop_data.get("email")
 
-    if prop_type == "phone_number":
-        return prop_data.get("phone_number")
+def _formula(prop_data: dict[str, Any]) -> Any:
+    return transform_property_value(prop_data.get("formula", {}))
 
-    if prop_type == "formula":
-        return transform_property_value(prop_data.get("formula", {}))
 
-    if prop_type == "relation":
-        return [r.get("id") for r in prop_data.get("relation", [])]
+def _relation(prop_data: dict[str, Any]) -> list[str | None]:
+    return [r.get("id") for r in prop_data.get("relation", [])]
 
-    if prop_type == "people":
-        return [p.get("id") for p in prop_data.get("people", [])]
 
-    if prop_type == "files":
-        return [f.get("name") for f in prop_data.get("files", [])]
+def _people(prop_data: dict[str, Any]) -> list[str | None]:
+    return [p.get("id") for p in prop_data.get("people", [])]
 
-    if prop_type == "created_time":
-        return prop_data.get("created_time")
 
-    if prop_type == "created_by":
-        return prop_data.get("created_by")
+def _files(prop_data: dict[str, Any]) -> list[str | None]:
+    return [f.get("name") for f in prop_data.get("files", [])]
 
-    if prop_type == "last_edited_time":
-        return prop_data.get("last_edited_time")
 
-    if prop_type == "last_edited_by":
-        return prop_data.get("last_edited_by")
+def _created_time(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("created_time")
 
+
+def _created_by(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("created_by")
+
+
+def _last_edited_time(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("last_edited_time")
+
+
+def _last_edited_by(prop_data: dict[str, Any]) -> Any:
+    return prop_data.get("last_edited_by")
+
+
+def _raw(prop_data: dict[str, Any]) -> Any:
     # For unknown types, return raw data
     return prop_data
+
+
+# Handlers keyed by Notion property type
+_HANDLERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "title": _title,
+    "rich_text": _rich_text,
+    "number": _number,
+    "select": _select,
+    "multi_select": _multi_select,
+    "status": _status,
+    "date": _date,
+    "checkbox": _checkbox,
+    "url": _url,
+    "email": _email,
+    "phone_number": _phone_number,
+    "formula": _formula,
+    "relation": _relation,
+    "people": _people,
+    "files": _files,
+    "created_time": _created_time,
+    "created_by": _created_by,
+    "last_edited_time": _last_edited_time,
+    "last_edited_by": _last_edited_by,
+}
+
+
+def transform_property_value(prop_data: dict[str, Any]) -> Any:
+    """Transform a Notion property value to a more useful format."""
+    return _HANDLERS.get(prop_data.get("type"), _raw)(prop_data)
+
+
+def to_arrow(pages: list[dict[str, Any]], property_names: list[str]) -> Any:
+    """Transform raw Notion pages into a columnar Arrow table.
+
+    Page metadata becomes top-level columns and properties become children of
+    a "properties" struct column, mirroring the JSON output shape. Values that
+    are still Notion objects (types without a handler, such as buttons,
+    rollups or unique IDs, and user objects) are stored as JSON strings so
+    columns don't depend on their nested shape.
+
+    Requires the optional pyarrow dependency.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise RuntimeError(
+            "Arrow/Parquet output requires pyarrow: pip install 'notion-kanban-cli[arrow]'"
+        ) from e
+
+    import orjson
+
+    n = len(pages)
+    meta_names = ("id", "created_time", "last_edited_time", "archived", "url")
+    meta_columns = [[None] * n for _ in meta_names]
+    prop_columns = [[None] * n for _ in property_names]
+
+    _transform = transform_property_value
+    for i, page in enumerate(pages):
+        for name, column in zip(meta_names, meta_columns):
+            column[i] = page.get(name)
+        props = page.get("properties", {})
+        for name, column in zip(property_names, prop_columns):
+            prop_data = props.get(name)
+            if prop_data is not None:
+                value = _transform(prop_data)
+                column[i] = orjson.dumps(value).decode() if isinstance(value, dict) else value
+
+    columns = {name: pa.array(column) for name, column in zip(meta_names, meta_columns)}
+    if property_names:
+        columns["properties"] = pa.StructArray.from_arrays(
+            [pa.array(column) for column in prop_columns], names=property_names
+        )
+    return pa.table(columns)
+
+
+def transform_properties(props: dict[str, Any]) -> dict[str, Any]:
+    """Transform every property of a page."""
+    _transform = transform_property_value
+    return {k: _transform(v) for k, v in props.items()}
+
+
+def compile_page_transformer(prop_types: dict[str, str]) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Generate a transform_properties() specialized for a fixed set of properties.
+
+    The generated function calls each property's handler directly instead of
+    looking it up for every page. Pages whose properties don't match the
+    compiled names and types (e.g. the schema changed since it was cached)
+    fall back to transform_properties().
+
+    Args:
+        prop_types: Property types keyed by property name, in output order
+    """
+    namespace: dict[str, Any] = {"_generic": transform_properties}
+    checks = [f"len(props) == {len(prop_types)}"]
+    entries = []
+    for i, (name, prop_type) in enumerate(prop_types.items()):
+        namespace[f"_h{i}"] = _HANDLERS.get(prop_type, _raw)
+        checks.append(f"props[{name!r}]['type'] == {prop_type!r}")
+        entries.append(f"{name!r}: _h{i}(props[{name!r}])")
+
+    source = (
+        "def _transform(props):\n"
+        "    try:\n"
+        f"        if {' and '.join(checks)}:\n"
+        f"            return {{{', '.join(entries)}}}\n"
+        "    except KeyError:\n"
+        "        pass\n"
+        "    return _generic(props)\n"
+    )
+    exec(compile(source, "<page-transformer>", "exec"), namespace)
+    return namespace["_transform"]
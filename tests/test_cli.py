@@ -0,0 +1,171 @@
+"""Tests for CLI helpers and commands."""
+
+import json
+
+import pytest
+from notion_kanban_cli import cli
+from notion_kanban_cli import schema as schema_module
+from notion_kanban_cli.cli import app, build_query_filter
+from notion_kanban_cli.client import NotionAPIError
+from notion_kanban_cli.schema import DatabaseSchema
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+SCHEMA_DATA = {
+    "properties": {
+        "Name": {"id": "title", "name": "Name", "type": "title"},
+        "Status": {
+            "id": "s%3A1",
+            "name": "Status",
+            "type": "status",
+            "status": {"options": [{"name": "Todo"}, {"name": "Done"}]},
+        },
+    }
+}
+
+
+class StubClient:
+    """NotionClient stand-in that records the calls commands make."""
+
+    def __init__(self):
+        self.queries = []
+        self.updates = []
+
+    async def get_database(self, database_id: str) -> dict:
+        return SCHEMA_DATA
+
+    async def iterate_database(self, database_id: str, **kwargs):
+        self.queries.append(kwargs)
+        yield {"results": [], "next_cursor": None, "has_more": False}
+
+    async def update_page(self, page_id: str, properties: dict) -> dict:
+        if page_id == "missing":
+            raise NotionAPIError("Could not find page", status_code=404)
+        self.updates.append((page_id, properties))
+        return {}
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_client(tmp_path, monkeypatch):
+    """Run commands against a StubClient with an isolated schema cache."""
+    client = StubClient()
+    monkeypatch.setattr(cli, "NotionClient", lambda: client)
+    monkeypatch.setattr(schema_module, "_disk_cache_dir", lambda: tmp_path)
+    schema_module._schema_cache.clear()
+    yield client
+    schema_module._schema_cache.clear()
+
+
+def _schema() -> DatabaseSchema:
+    return DatabaseSchema(
+        "db-id",
+        {
+            "properties": {
+                "Name": {"id": "title", "type": "title"},
+                "Status": {"id": "s1", "type": "status"},
+                "Tags": {"id": "t1", "type": "multi_select"},
+                "Priority": {"id": "p1", "name": "Priority", "type": "select"},
+            }
+        },
+    )
+
+
+def test_build_query_filter_empty():
+    """Test that no options produce no filter."""
+    assert build_query_filter(_schema()) is None
+
+
+def test_build_query_filter_single_predicate():
+    """Test that a single predicate is sent unwrapped."""
+    assert build_query_filter(_schema(), status="Done") == {
+        "property": "Status",
+        "status": {"equals": "Done"},
+    }
+
+
+def test_build_query_filter_combines_predicates():
+    """Test that status, tags and custom filters are combined with 'and'."""
+    filter_obj = build_query_filter(_schema(), status="Done", tags="a, b", filter="Priority=high")
+    assert filter_obj == {
+        "and": [
+            {"property": "Status", "status": {"equals": "Done"}},
+            {"property": "Tags", "multi_select": {"contains": "a"}},
+            {"property": "Tags", "multi_select": {"contains": "b"}},
+            {"property": "Priority", "select": {"equals": "high"}},
+        ]
+    }
+
+
+def test_build_query_filter_uses_schema_property_name():
+    """Test that custom filters match property names case-insensitively."""
+    assert build_query_filter(_schema(), filter="priority=high") == {
+        "property": "Priority",
+        "select": {"equals": "high"},
+    }
+
+
+def test_build_query_filter_unknown_property():
+    """Test that filtering on a missing property is an error."""
+    with pytest.raises(ValueError):
+        build_query_filter(_schema(), filter="missing=x")
+
+
+def test_query_properties_resolves_ids(stub_client):
+    """Test that --properties is sent as the schema's property IDs."""
+    result = runner.invoke(app, ["query", "-d", "db", "-p", "name,STATUS"])
+    assert json.loads(result.stdout)["success"] is True
+    assert stub_client.queries[0]["filter_property_ids"] == ["title", "s%3A1"]
+
+
+def test_query_unknown_property(stub_client):
+    """Test that an unknown --properties name is reported without querying."""
+    result = runner.invoke(app, ["query", "-d", "db", "-p", "Name,Missing"])
+    output = json.loads(result.stdout)
+    assert output["success"] is False
+    assert output["error"]["message"] == "Unknown property 'Missing'"
+    assert output["error"]["available_options"] == ["Name", "Status"]
+    assert stub_client.queries == []
+
+
+def test_bulk_update_status(stub_client):
+    """Test that bulk updates apply valid lines and report each failure."""
+    lines = [
+        '{"id": "page-1", "status": "Done"}',
+        "",
+        "not json",
+        "[1]",
+        '"x"',
+        '{"id": "page-2", "status": "Blocked"}',
+        '{"id": "missing", "status": "Todo"}',
+        '{"id": "page-3", "status": "Todo"}',
+    ]
+    result = runner.invoke(app, ["bulk-update-status", "-d", "db"], input="\n".join(lines) + "\n")
+    output = json.loads(result.stdout)
+
+    assert stub_client.updates == [
+        ("page-1", {"Status": {"status": {"name": "Done"}}}),
+        ("page-3", {"Status": {"status": {"name": "Todo"}}}),
+    ]
+    assert output["success"] is False
+    assert output["data"] == {"property": "Status", "updated": 2, "failed": 5}
+    assert output["error"]["message"] == "5 update(s) failed"
+
+    failures = output["error"]["failures"]
+    assert [f.get("line") for f in failures[:4]] == [3, 4, 5, 6]
+    assert failures[3]["message"] == "Invalid status 'Blocked'"
+    assert failures[3]["available_options"] == ["Todo", "Done"]
+    assert failures[4] == {"id": "missing", "message": "Could not find page", "status_code": 404}
+
+
+def test_bulk_update_status_all_succeed(stub_client):
+    """Test that a fully successful bulk update reports success."""
+    result = runner.invoke(app, ["bulk-update-status", "-d", "db"], input='{"id": "page-1", "status": "Done"}\n')
+    output = json.loads(result.stdout)
+    assert output["success"] is True
+    assert output["data"]["updated"] == 1
+    assert output["data"]["failed"] == 0
+    assert output["error"] is None
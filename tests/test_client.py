@@ -1,7 +1,19 @@
 """Tests for Notion API client."""
 
+import json
+import time
+
+import httpx
 import pytest
-from notion_kanban_cli.client import NotionClient, NotionAPIError
+from notion_kanban_cli.client import NotionAPIError, NotionClient, _env_proxy, _TokenBucket
+
+
+def _unthrottled_client(handler) -> NotionClient:
+    """Create a client backed by a mock transport and without rate limiting."""
+    client = NotionClient(api_key="test-key")
+    client._rate_limiter = _TokenBucket(rate=1e9, capacity=1e9)
+    client._client = httpx.AsyncClient(base_url="https://api.notion.test", transport=httpx.MockTransport(handler))
+    return client
 
 
 @pytest.mark.asyncio
@@ -25,3 +37,133 @@ def test_api_error():
     error = NotionAPIError("Test error", status_code=400)
     assert str(error) == "Test error"
     assert error.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_iterate_database_follows_cursor():
+    """Test that iterate_database pages through results up to the limit."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        start = int(body.get("start_cursor") or 0)
+        end = min(start + body["page_size"], 5)
+        return httpx.Response(
+            200,
+            json={
+                "results": [{"id": str(i)} for i in range(start, end)],
+                "next_cursor": str(end) if end < 5 else None,
+                "has_more": end < 5,
+            },
+        )
+
+    client = _unthrottled_client(handler)
+
+    batches = [batch async for batch in client.iterate_database("db", page_size=2, limit=3)]
+    assert [page["id"] for batch in batches for page in batch["results"]] == ["0", "1", "2"]
+    assert [body["page_size"] for body in requests] == [2, 1]
+    assert batches[-1]["has_more"] is True
+
+    batches = [batch async for batch in client.iterate_database("db", page_size=2)]
+    assert sum(len(batch["results"]) for batch in batches) == 5
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_query_database_filter_properties_encoding():
+    """Test that URL-encoded property IDs are sent encoded exactly once."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"results": [], "next_cursor": None, "has_more": False})
+
+    client = _unthrottled_client(handler)
+    await client.query_database("db", filter_property_ids=["title", "s%3A1"])
+    assert requests[0].url.query == b"filter_properties=title&filter_properties=s%3A1"
+    await client.close()
+
+@pytest.mark.asyncio
+async def test_request_retries_rate_limited_responses():
+    """Test that 429 responses are retried using Retry-After."""
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "0"}, json={"message": "Rate limited"}),
+        httpx.Response(200, json={"object": "page"}),
+    ]
+
+    client = _unthrottled_client(lambda request: responses.pop(0))
+
+    assert await client.get_page("page-id") == {"object": "page"}
+    assert responses == []
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_request_raises_after_retries_exhausted():
+    """Test that the last error is raised once retries run out."""
+    client = _unthrottled_client(lambda request: httpx.Response(503, json={"message": "Unavailable"}))
+    client._retry_policy = {"max": 2, "base": 0, "max_delay": 0}
+
+    with pytest.raises(NotionAPIError) as exc_info:
+        await client.get_page("page-id")
+    assert exc_info.value.status_code == 503
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_request_not_retried_on_server_error():
+    """Test that a failed POST /comments is not repeated, which could duplicate the comment."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(502, json={"message": "Bad gateway"})
+
+    client = _unthrottled_client(handler)
+    client._retry_policy = {"max": 2, "base": 0, "max_delay": 0}
+
+    with pytest.raises(NotionAPIError):
+        await client.add_comment("page-id", "discussion-id", "Hello")
+    assert len(requests) == 1
+    await client.close()
+
+
+def test_retry_delay_is_capped():
+    """Test that a long Retry-After is capped."""
+    client = NotionClient(api_key="test-key")
+    response = httpx.Response(429, headers={"Retry-After": "3600"})
+    assert client._retry_delay(response, 0) == client._retry_policy["max_delay"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_limits_rate():
+    """Test that requests beyond the burst wait for tokens to refill."""
+    bucket = _TokenBucket(rate=50, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # Two tokens are available immediately, the other two take 1/50s each
+    assert time.monotonic() - start >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_client_uses_environment_proxy(monkeypatch):
+    """Test that HTTPS_PROXY is honoured by the custom transport."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+
+    client = NotionClient(api_key="test-key")
+    http_client = await client._get_client()
+    pool = http_client._transport._pool
+    assert type(pool).__name__ == "AsyncHTTPProxy"
+    assert pool._proxy_url.host == b"proxy.test"
+    await client.close()
+
+
+def test_no_proxy_bypasses_environment_proxy(monkeypatch):
+    """Test that NO_PROXY disables the proxy for the Notion API."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+    monkeypatch.setenv("NO_PROXY", "api.notion.com")
+    assert _env_proxy("https://api.notion.com/v1") is None
@@ -0,0 +1,37 @@
+"""Tests for custom query filter parsing."""
+
+import pytest
+from notion_kanban_cli.filter_dsl import build_filter, parse_filter
+
+
+def test_parse_filter():
+    """Test parsing property, operator and value."""
+    assert parse_filter("priority=high") == ("priority", "=", "high")
+    assert parse_filter(" Due Date != 2024-01-01 ") == ("Due Date", "!=", "2024-01-01")
+    assert parse_filter("note=a=b") == ("note", "=", "a=b")
+
+
+def test_parse_filter_invalid():
+    """Test that expressions without an operator are rejected."""
+    with pytest.raises(ValueError):
+        parse_filter("priority")
+
+
+def test_build_filter_by_type():
+    """Test that conditions match the property type."""
+    assert build_filter("Priority", "select", "=", "high") == {
+        "property": "Priority",
+        "select": {"equals": "high"},
+    }
+    assert build_filter("Tags", "multi_select", "!=", "x") == {
+        "property": "Tags",
+        "multi_select": {"does_not_contain": "x"},
+    }
+    assert build_filter("Points", "number", "=", "3") == {"property": "Points", "number": {"equals": 3.0}}
+    assert build_filter("Done", "checkbox", "=", "true") == {"property": "Done", "checkbox": {"equals": True}}
+
+
+def test_build_filter_unsupported_type():
+    """Test that unsupported property types raise a clear error."""
+    with pytest.raises(ValueError):
+        build_filter("Files", "files", "=", "x")
@@ -0,0 +1,60 @@
+"""Tests for schema discovery and caching."""
+
+import pytest
+from notion_kanban_cli import schema as schema_module
+from notion_kanban_cli.schema import get_database_schema
+
+SCHEMA_DATA = {"properties": {"Status": {"id": "s1", "type": "status"}}}
+
+
+class FakeClient:
+    """Client stub that counts schema fetches."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_database(self, database_id: str) -> dict:
+        self.calls += 1
+        return SCHEMA_DATA
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Point the disk cache at a temporary directory and start empty."""
+    monkeypatch.setattr(schema_module, "_disk_cache_dir", lambda: tmp_path)
+    schema_module._schema_cache.clear()
+    yield
+    schema_module._schema_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_schema_persisted_to_disk():
+    """Test that a fresh process reuses the schema written to disk."""
+    client = FakeClient()
+    await get_database_schema(client, "db-id")
+    schema_module._schema_cache.clear()
+
+    schema = await get_database_schema(client, "db-id")
+    assert client.calls == 1
+    assert schema.get_status_property_name() == "Status"
+
+
+@pytest.mark.asyncio
+async def test_expired_schema_refetched(monkeypatch):
+    """Test that schemas older than the TTL are fetched again."""
+    client = FakeClient()
+    await get_database_schema(client, "db-id")
+    schema_module._schema_cache.clear()
+    monkeypatch.setattr(schema_module, "SCHEMA_CACHE_TTL_SECONDS", -1)
+
+    await get_database_schema(client, "db-id")
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_bypasses_cache():
+    """Test that refresh=True always hits the API."""
+    client = FakeClient()
+    await get_database_schema(client, "db-id")
+    await get_database_schema(client, "db-id", refresh=True)
+    assert client.calls == 2
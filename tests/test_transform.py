@@ -0,0 +1,91 @@
+"""Tests for property transformation utilities."""
+
+import pytest
+from notion_kanban_cli.transform import (
+    compile_page_transformer,
+    to_arrow,
+    transform_properties,
+    transform_property_value,
+)
+
+
+def test_transform_known_types():
+    """Test transforming common property types."""
+    assert transform_property_value({"type": "title", "title": [{"plain_text": "a"}, {"plain_text": "b"}]}) == "ab"
+    assert transform_property_value({"type": "status", "status": {"name": "Done"}}) == "Done"
+    assert transform_property_value({"type": "select", "select": None}) is None
+    assert transform_property_value({"type": "multi_select", "multi_select": [{"name": "x"}]}) == ["x"]
+
+
+def test_transform_unknown_type_returns_raw():
+    """Test that unknown property types are returned unchanged."""
+    prop_data = {"type": "button", "button": {}}
+    assert transform_property_value(prop_data) is prop_data
+
+
+def test_compile_page_transformer():
+    """Test that the generated transformer matches the generic one."""
+    props = {
+        "Name": {"type": "title", "title": [{"plain_text": "Task"}]},
+        "Status": {"type": "status", "status": {"name": "Done"}},
+    }
+    transform = compile_page_transformer({"Name": "title", "Status": "status"})
+    assert transform(props) == transform_properties(props)
+
+    # Pages that don't match the compiled schema use the generic path
+    stale = {"Name": props["Name"], "Renamed": props["Status"]}
+    assert transform(stale) == {"Name": "Task", "Renamed": "Done"}
+
+
+def test_compile_page_transformer_type_change():
+    """Test that a property whose type changed uses the generic path."""
+    transform = compile_page_transformer({"Stage": "select"})
+    props = {"Stage": {"type": "status", "status": {"name": "Done"}}}
+    assert transform(props) == {"Stage": "Done"}
+
+
+def test_to_arrow():
+    """Test building a columnar table from raw pages."""
+    pytest.importorskip("pyarrow")
+    pages = [
+        {
+            "id": "p1",
+            "archived": False,
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "First"}]},
+                "Tags": {"type": "multi_select", "multi_select": [{"name": "a"}]},
+            },
+        },
+        {"id": "p2", "archived": True, "properties": {"Name": {"type": "title", "title": []}}},
+    ]
+
+    table = to_arrow(pages, ["Name", "Tags"])
+    assert table.num_rows == 2
+    assert table.column("id").to_pylist() == ["p1", "p2"]
+    assert table.column("properties").to_pylist() == [
+        {"Name": "First", "Tags": ["a"]},
+        {"Name": "", "Tags": None},
+    ]
+
+
+def test_to_arrow_unhandled_types_as_json():
+    """Test that properties without a handler are stored as JSON and can be written to Parquet."""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    pages = [
+        {
+            "id": "p1",
+            "properties": {
+                "Name": {"type": "title", "title": [{"plain_text": "First"}]},
+                "Run": {"type": "button", "button": {}},
+            },
+        }
+    ]
+
+    table = to_arrow(pages, ["Name", "Run"])
+    assert table.column("properties").to_pylist() == [
+        {"Name": "First", "Run": '{"type":"button","button":{}}'}
+    ]
+
+    sink = pa.BufferOutputStream()
+    pq.write_table(table, sink)